@@ -8,16 +8,21 @@ Provides visibility into agents, MCP servers, browsers, and other child processe
 
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
-from ..services.process_registry import get_registry
+from ..services.process_registry import ProcessNotRegistered, get_registry
 
 
 router = APIRouter(prefix="/api/processes", tags=["processes"])
 
+# Bound once at import rather than looked up in every handler
+registry = get_registry()
 
-# Response models
+
+# Response models (used for OpenAPI docs only; handlers return plain dicts
+# so FastAPI doesn't revalidate registry output on every request)
 class ProcessInfo(BaseModel):
     """Information about a single process."""
     pid: int
@@ -54,38 +59,38 @@ class KillAllResponse(BaseModel):
 ProcessInfo.model_rebuild()
 
 
-@router.get("", response_model=List[ProjectProcesses])
+@router.get("", responses={200: {"model": List[ProjectProcesses]}})
 async def list_all_processes():
     """
     Get all running processes grouped by project.
 
     Returns a tree structure showing agents and their child processes.
+    The tree is served as cached, pre-encoded JSON.
     """
-    registry = get_registry()
-    return registry.get_process_tree()
+    # Building and encoding the tree is blocking work, keep it off the event loop
+    content = await run_in_threadpool(registry.get_process_tree_json)
+    return Response(content=content, media_type="application/json")
 
 
-@router.get("/flat", response_model=List[ProcessInfo])
+@router.get("/flat", responses={200: {"model": List[ProcessInfo]}})
 async def list_all_processes_flat():
     """
     Get all running processes as a flat list.
 
     Useful for simpler displays or filtering.
     """
-    registry = get_registry()
     processes = registry.get_all()
-    return [p.to_dict() for p in processes]
+    return [{**p.to_dict(), "children": []} for p in processes]
 
 
-@router.get("/project/{project_name}", response_model=List[ProcessInfo])
+@router.get("/project/{project_name}", responses={200: {"model": List[ProcessInfo]}})
 async def list_project_processes(project_name: str):
     """Get all processes for a specific project."""
-    registry = get_registry()
     processes = registry.get_by_project(project_name)
-    return [p.to_dict() for p in processes]
+    return [{**p.to_dict(), "children": []} for p in processes]
 
 
-@router.post("/{pid}/kill", response_model=ProcessActionResponse)
+@router.post("/{pid}/kill", responses={200: {"model": ProcessActionResponse}})
 async def kill_process(pid: int, force: bool = False):
     """
     Kill a specific process.
@@ -94,21 +99,14 @@ async def kill_process(pid: int, force: bool = False):
         pid: Process ID to kill
         force: If True, use SIGKILL instead of SIGTERM
     """
-    registry = get_registry()
-
-    # Verify process is in our registry
-    process = registry.get_by_pid(pid)
-    if not process:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Process {pid} not found in registry"
-        )
+    try:
+        success, message = await run_in_threadpool(registry.kill_process, pid, force=force)
+    except ProcessNotRegistered as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return {"success": success, "message": message}
 
-    success, message = registry.kill_process(pid, force=force)
-    return ProcessActionResponse(success=success, message=message)
 
-
-@router.post("/project/{project_name}/kill", response_model=KillAllResponse)
+@router.post("/project/{project_name}/kill", responses={200: {"model": KillAllResponse}})
 async def kill_project_processes(project_name: str, force: bool = False):
     """
     Kill all processes for a specific project.
@@ -117,17 +115,16 @@ async def kill_project_processes(project_name: str, force: bool = False):
         project_name: Project name
         force: If True, use SIGKILL
     """
-    registry = get_registry()
-    killed, failed = registry.kill_by_project(project_name, force=force)
+    killed, failed = await run_in_threadpool(registry.kill_by_project, project_name, force=force)
 
-    return KillAllResponse(
-        killed=killed,
-        failed=failed,
-        message=f"Killed {killed} process(es), {failed} failed"
-    )
+    return {
+        "killed": killed,
+        "failed": failed,
+        "message": f"Killed {killed} process(es), {failed} failed",
+    }
 
 
-@router.post("/kill-all", response_model=KillAllResponse)
+@router.post("/kill-all", responses={200: {"model": KillAllResponse}})
 async def kill_all_processes(force: bool = False):
     """
     Emergency stop - kill ALL registered processes.
@@ -135,64 +132,36 @@ async def kill_all_processes(force: bool = False):
     Args:
         force: If True, use SIGKILL for immediate termination
     """
-    registry = get_registry()
-    killed, failed = registry.kill_all(force=force)
+    killed, failed = await run_in_threadpool(registry.kill_all, force=force)
 
-    return KillAllResponse(
-        killed=killed,
-        failed=failed,
-        message=f"Emergency stop complete. Killed {killed} process(es), {failed} failed"
-    )
+    return {
+        "killed": killed,
+        "failed": failed,
+        "message": f"Emergency stop complete. Killed {killed} process(es), {failed} failed",
+    }
 
 
-@router.post("/{pid}/pause", response_model=ProcessActionResponse)
+@router.post("/{pid}/pause", responses={200: {"model": ProcessActionResponse}})
 async def pause_process(pid: int):
     """Pause a specific process using SIGSTOP."""
-    registry = get_registry()
-
-    process = registry.get_by_pid(pid)
-    if not process:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Process {pid} not found in registry"
-        )
+    try:
+        success, message = await run_in_threadpool(registry.pause_process, pid)
+    except ProcessNotRegistered as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return {"success": success, "message": message}
 
-    success, message = registry.pause_process(pid)
-    return ProcessActionResponse(success=success, message=message)
 
-
-@router.post("/{pid}/resume", response_model=ProcessActionResponse)
+@router.post("/{pid}/resume", responses={200: {"model": ProcessActionResponse}})
 async def resume_process(pid: int):
     """Resume a paused process."""
-    registry = get_registry()
-
-    process = registry.get_by_pid(pid)
-    if not process:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Process {pid} not found in registry"
-        )
-
-    success, message = registry.resume_process(pid)
-    return ProcessActionResponse(success=success, message=message)
+    try:
+        success, message = await run_in_threadpool(registry.resume_process, pid)
+    except ProcessNotRegistered as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return {"success": success, "message": message}
 
 
 @router.get("/count")
 async def get_process_count():
     """Get a count of running processes."""
-    registry = get_registry()
-    processes = registry.get_all()
-
-    # Count by type
-    agents = sum(1 for p in processes if p.name == "agent")
-    browsers = sum(1 for p in processes if "browser" in p.name or "chrome" in p.name)
-    mcp_servers = sum(1 for p in processes if "mcp" in p.name)
-    other = len(processes) - agents - browsers - mcp_servers
-
-    return {
-        "total": len(processes),
-        "agents": agents,
-        "browsers": browsers,
-        "mcp_servers": mcp_servers,
-        "other": other,
-    }
+    return registry.get_process_count()
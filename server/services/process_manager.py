@@ -235,10 +235,12 @@ class AgentProcessManager:
                 await asyncio.sleep(5)  # Check every 5 seconds
 
                 if self.process and self.status == "running":
-                    # Discover new child processes
-                    registry.discover_children(self.process.pid, self.project_name)
-                    # Clean up dead processes
-                    registry.cleanup_dead_processes()
+                    # Discover new child processes (dead ones are pruned by
+                    # the registry's own background sweep). Reading /proc
+                    # blocks, so keep it off the event loop.
+                    await asyncio.to_thread(
+                        registry.discover_children, self.process.pid, self.project_name
+                    )
 
         except asyncio.CancelledError:
             raise
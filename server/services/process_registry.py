@@ -8,18 +8,54 @@ child processes (MCP servers like Playwright).
 Provides visibility into all running processes and emergency kill functionality.
 """
 
+import itertools
+import json
 import logging
 import threading
+import time
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Literal, Optional
+from typing import Dict, Iterable, List, Literal, Optional
 
 import psutil
 
 logger = logging.getLogger(__name__)
 
+# Longest command line kept per process; Chrome helpers can run to several KB
+_MAX_CMDLINE_LENGTH = 200
 
-@dataclass
+# Seconds between background sweeps for processes that have exited
+_CLEANUP_INTERVAL = 5.0
+
+# Ordered (keywords, refinements, label) rules for MCP servers and browsers,
+# checked against the lowercased command line in ProcessRegistry._identify_process.
+# The first rule with any matching keyword wins; its first matching
+# refinement keyword, if any, picks a more specific label.
+_CMDLINE_LABELS: tuple[tuple[tuple[str, ...], tuple[tuple[str, str], ...], str], ...] = (
+    (("playwright",), (), "playwright-mcp"),  # also covers @playwright/mcp
+    (("feature_mcp",), (), "feature-mcp"),
+    (("chromium", "chrome"), (("helper", "chrome-helper"),), "chrome-browser"),
+    (("firefox",), (), "firefox-browser"),
+    (("webkit", "safari"), (), "webkit-browser"),
+)
+
+# Ordered (keyword, label) refinements for Node.js processes
+_NODE_LABELS: tuple[tuple[str, str], ...] = (
+    ("vite", "vite-dev-server"),
+    ("next", "next-dev-server"),
+)
+
+
+class ProcessNotRegistered(Exception):
+    """Action targeted a PID that isn't tracked by the registry."""
+
+    def __init__(self, pid: int):
+        super().__init__(f"Process {pid} not found in registry")
+        self.pid = pid
+
+
+@dataclass(slots=True)
 class ProcessInfo:
     """Information about a tracked process."""
     pid: int
@@ -28,47 +64,92 @@ class ProcessInfo:
     status: Literal["running", "paused", "stopped"] = "running"
     started_at: datetime = field(default_factory=datetime.now)
     parent_pid: Optional[int] = None
-    cmdline: str = ""
+    cmdline: str = ""  # Truncated to _MAX_CMDLINE_LENGTH on registration
+    # Memoized to_dict() result, rebuilt whenever its status is out of date
+    _cached_dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "pid": self.pid,
-            "name": self.name,
-            "project_name": self.project_name,
-            "status": self.status,
-            "started_at": self.started_at.isoformat(),
-            "parent_pid": self.parent_pid,
-            "cmdline": self.cmdline[:200] if self.cmdline else "",  # Truncate long cmdlines
-        }
+        """
+        Convert to dictionary for JSON serialization.
+
+        The result is cached and shared between callers, so it must not be
+        mutated. It is rebuilt after the status changes.
+        """
+        cached = self._cached_dict
+        # Status is the only field that changes after registration. Comparing
+        # it (rather than clearing the memo on update) means a to_dict() racing
+        # a status update can never leave a stale dict cached.
+        if cached is None or cached["status"] != self.status:
+            cached = self._cached_dict = {
+                "pid": self.pid,
+                "name": self.name,
+                "project_name": self.project_name,
+                "status": self.status,
+                "started_at": self.started_at.isoformat(),
+                "parent_pid": self.parent_pid,
+                "cmdline": self.cmdline,
+            }
+        return cached
+
+
+def _process_category(name: str) -> str:
+    """Bucket a registered process name for get_process_count()."""
+    if name == "agent":
+        return "agent"
+    if "browser" in name or "chrome" in name:
+        return "browser"
+    if "mcp" in name:
+        return "mcp"
+    return "other"
+
+
+def _discard_from_index(by_project: Dict[str, tuple[int, ...]], info: ProcessInfo) -> None:
+    """Remove a process from a project -> PIDs index, dropping empty projects."""
+    remaining = tuple(pid for pid in by_project.get(info.project_name, ()) if pid != info.pid)
+    if remaining:
+        by_project[info.project_name] = remaining
+    else:
+        by_project.pop(info.project_name, None)
 
 
 class ProcessRegistry:
     """
     Central registry for tracking all spawned processes.
 
-    Thread-safe singleton that tracks:
+    Thread-safe registry that tracks:
     - Agent processes (main autonomous_agent_demo.py processes)
     - Child processes (MCP servers, browsers, etc.)
-    """
 
-    _instance: Optional["ProcessRegistry"] = None
-    _lock = threading.Lock()
+    A single shared instance is created at import time; use get_registry().
 
-    def __new__(cls) -> "ProcessRegistry":
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
+    The process map is copy-on-write: writers that add or remove entries
+    build a new dict under ``_registry_lock`` and swap it in. Single-key
+    reads and status updates are plain atomic operations and take no lock.
+    Anything that iterates must first take a local reference to
+    ``self._processes`` (a snapshot) and iterate that.
+    """
 
     def __init__(self):
-        if self._initialized:
-            return
         self._processes: Dict[int, ProcessInfo] = {}
+        # Secondary index: project name -> PIDs in registration order,
+        # swapped alongside _processes
+        self._by_project: Dict[str, tuple[int, ...]] = {}
+        # Running totals per _process_category, swapped alongside _processes
+        self._counts: Dict[str, int] = {"agent": 0, "browser": 0, "mcp": 0, "other": 0}
         self._registry_lock = threading.Lock()
-        self._initialized = True
+        # Cached (timestamp, generation, tree) from get_process_tree
+        self._tree_cache: Optional[tuple[float, int, List[dict]]] = None
+        self._tree_ttl = 1.0  # seconds
+        # Bumped after every mutation; a cached tree is only served while its
+        # generation is current. next() on a count is atomic, so lock-free
+        # writers can bump it too.
+        self._generation_counter = itertools.count(1)
+        self._generation = 0
+        # (tree, encoded JSON) for the most recent tree served as JSON
+        self._tree_json: Optional[tuple[List[dict], bytes]] = None
+        # Background thread pruning dead PIDs, started on first registration
+        self._cleanup_thread: Optional[threading.Thread] = None
+        self._cleanup_stop = threading.Event()
         logger.info("Process registry initialized")
 
     def register(
@@ -92,17 +173,100 @@ class ProcessRegistry:
         Returns:
             The registered ProcessInfo
         """
+        info = ProcessInfo(
+            pid=pid,
+            name=name,
+            project_name=project_name,
+            parent_pid=parent_pid,
+            cmdline=cmdline[:_MAX_CMDLINE_LENGTH],
+        )
+        self._add_all([info])
+        return info
+
+    def _add_all(self, infos: List[ProcessInfo]) -> None:
+        """Insert several processes with a single copy-on-write swap."""
         with self._registry_lock:
-            info = ProcessInfo(
-                pid=pid,
-                name=name,
-                project_name=project_name,
-                parent_pid=parent_pid,
-                cmdline=cmdline,
-            )
-            self._processes[pid] = info
-            logger.info(f"Registered process: {name} (PID {pid}) for project {project_name}")
-            return info
+            processes = dict(self._processes)
+            by_project = dict(self._by_project)
+            counts = dict(self._counts)
+            for info in infos:
+                previous = processes.get(info.pid)
+                if previous is not None:
+                    counts[_process_category(previous.name)] -= 1
+                # Re-registering within the same project keeps the PID's position
+                if previous is None or previous.project_name != info.project_name:
+                    if previous is not None:
+                        _discard_from_index(by_project, previous)
+                    by_project[info.project_name] = by_project.get(info.project_name, ()) + (info.pid,)
+                processes[info.pid] = info
+                counts[_process_category(info.name)] += 1
+                logger.info(
+                    f"Registered process: {info.name} (PID {info.pid}) for project {info.project_name}"
+                )
+            self._processes = processes
+            self._by_project = by_project
+            self._counts = counts
+            self._invalidate_tree()
+
+            if self._cleanup_thread is None and not self._cleanup_stop.is_set():
+                self._cleanup_thread = threading.Thread(
+                    target=self._cleanup_loop,
+                    name="process-registry-cleanup",
+                    daemon=True,
+                )
+                self._cleanup_thread.start()
+
+    def close(self) -> None:
+        """Stop the background cleanup thread, if it was started."""
+        self._cleanup_stop.set()
+        thread = self._cleanup_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _invalidate_tree(self) -> None:
+        """Mark any cached process tree as stale. Call after each mutation."""
+        self._generation = next(self._generation_counter)
+
+    def _cleanup_loop(self) -> None:
+        """
+        Periodically remove dead processes so readers never probe liveness.
+
+        Not every tracked process is our own child (MCP servers and browsers
+        are spawned by Node), so SIGCHLD/waitpid can't see them exit. Reaping
+        our own children that way would also race the Popen objects that own
+        them, so one batched sweep covers everything instead.
+        """
+        while not self._cleanup_stop.wait(_CLEANUP_INTERVAL):
+            if not self._processes:
+                continue
+            try:
+                self.cleanup_dead_processes()
+            except Exception as e:
+                logger.warning(f"Process cleanup error: {e}")
+
+    def _remove_all(self, pids: Iterable[int]) -> List[ProcessInfo]:
+        """
+        Remove several processes with a single copy-on-write swap.
+
+        Must be called with ``_registry_lock`` held.
+        """
+        processes = dict(self._processes)
+        by_project = dict(self._by_project)
+        counts = dict(self._counts)
+        removed = []
+        for pid in pids:
+            info = processes.pop(pid, None)
+            if info is not None:
+                _discard_from_index(by_project, info)
+                counts[_process_category(info.name)] -= 1
+                removed.append(info)
+
+        if removed:
+            self._processes = processes
+            self._by_project = by_project
+            self._counts = counts
+            self._invalidate_tree()
+        return removed
 
     def unregister(self, pid: int) -> Optional[ProcessInfo]:
         """
@@ -115,10 +279,12 @@ class ProcessRegistry:
             The removed ProcessInfo, or None if not found
         """
         with self._registry_lock:
-            info = self._processes.pop(pid, None)
-            if info:
+            removed = self._remove_all([pid])
+            if removed:
+                info = removed[0]
                 logger.info(f"Unregistered process: {info.name} (PID {pid})")
-            return info
+                return info
+            return None
 
     def update_status(self, pid: int, status: Literal["running", "paused", "stopped"]) -> bool:
         """
@@ -131,33 +297,57 @@ class ProcessRegistry:
         Returns:
             True if process was found and updated, False otherwise
         """
-        with self._registry_lock:
-            if pid in self._processes:
-                self._processes[pid].status = status
-                return True
+        # Lock-free: a single attribute store is atomic, and to_dict()
+        # notices the new status on its own
+        info = self._processes.get(pid)
+        if info is None:
             return False
+        info.status = status
+        self._invalidate_tree()
+        return True
 
     def get_all(self) -> List[ProcessInfo]:
         """Get all registered processes."""
-        with self._registry_lock:
-            return list(self._processes.values())
+        return list(self._processes.values())
 
     def get_by_project(self, project_name: str) -> List[ProcessInfo]:
         """Get all processes for a specific project."""
-        with self._registry_lock:
-            return [p for p in self._processes.values() if p.project_name == project_name]
+        processes = self._processes
+        return [
+            processes[pid]
+            for pid in self._by_project.get(project_name, ())
+            if pid in processes
+        ]
 
     def get_by_pid(self, pid: int) -> Optional[ProcessInfo]:
         """Get a process by PID."""
-        with self._registry_lock:
-            return self._processes.get(pid)
+        return self._processes.get(pid)
+
+    def get_process_count(self) -> Dict[str, int]:
+        """
+        Get the number of registered processes by type.
+
+        Counts are maintained on register/unregister, so this is constant time.
+
+        Returns:
+            Dict with total, agents, browsers, mcp_servers and other counts
+        """
+        counts = self._counts
+        return {
+            "total": sum(counts.values()),
+            "agents": counts["agent"],
+            "browsers": counts["browser"],
+            "mcp_servers": counts["mcp"],
+            "other": counts["other"],
+        }
 
     def discover_children(self, parent_pid: int, project_name: str) -> List[ProcessInfo]:
         """
         Discover and register child processes of a parent process.
 
         Uses psutil to find all child processes recursively and registers
-        them with appropriate names based on their command line.
+        them with appropriate names based on their command line. This does
+        blocking /proc reads, so async callers should run it in a thread.
 
         Args:
             parent_pid: PID of the parent process
@@ -166,35 +356,36 @@ class ProcessRegistry:
         Returns:
             List of newly discovered and registered ProcessInfo objects
         """
-        discovered = []
-
         try:
             parent = psutil.Process(parent_pid)
             children = parent.children(recursive=True)
-
-            for child in children:
-                if child.pid in self._processes:
-                    continue  # Already registered
-
-                try:
-                    cmdline = " ".join(child.cmdline())
-                    name = self._identify_process(cmdline, child.name())
-
-                    info = self.register(
-                        pid=child.pid,
-                        name=name,
-                        project_name=project_name,
-                        parent_pid=parent_pid,
-                        cmdline=cmdline,
-                    )
-                    discovered.append(info)
-
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-
         except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
             logger.warning(f"Could not discover children of PID {parent_pid}: {e}")
+            return []
+
+        processes = self._processes
+        new_children = [child for child in children if child.pid not in processes]
+        if not new_children:
+            return []
 
+        discovered = []
+        for child in new_children:
+            try:
+                cmdline = " ".join(child.cmdline())
+                name = self._identify_process(cmdline, child.name())
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+
+            discovered.append(ProcessInfo(
+                pid=child.pid,
+                name=name,
+                project_name=project_name,
+                parent_pid=parent_pid,
+                cmdline=cmdline[:_MAX_CMDLINE_LENGTH],
+            ))
+
+        if discovered:
+            self._add_all(discovered)
         return discovered
 
     def _identify_process(self, cmdline: str, proc_name: str) -> str:
@@ -209,33 +400,26 @@ class ProcessRegistry:
             Human-readable process name
         """
         cmdline_lower = cmdline.lower()
+        proc_name_lower = proc_name.lower()
 
-        # MCP servers
-        if "playwright" in cmdline_lower or "@playwright/mcp" in cmdline_lower:
-            return "playwright-mcp"
-        if "feature_mcp" in cmdline_lower:
-            return "feature-mcp"
-
-        # Browsers (spawned by Playwright)
-        if "chromium" in cmdline_lower or "chrome" in cmdline_lower:
-            if "helper" in cmdline_lower:
-                return "chrome-helper"
-            return "chrome-browser"
-        if "firefox" in cmdline_lower:
-            return "firefox-browser"
-        if "webkit" in cmdline_lower or "safari" in cmdline_lower:
-            return "webkit-browser"
+        # MCP servers and browsers (spawned by Playwright)
+        for keywords, refinements, label in _CMDLINE_LABELS:
+            for keyword in keywords:
+                if keyword in cmdline_lower:
+                    for refinement, refined_label in refinements:
+                        if refinement in cmdline_lower:
+                            return refined_label
+                    return label
 
         # Node.js processes
-        if "node" in proc_name.lower() or "npx" in cmdline_lower:
-            if "vite" in cmdline_lower:
-                return "vite-dev-server"
-            if "next" in cmdline_lower:
-                return "next-dev-server"
+        if "node" in proc_name_lower or "npx" in cmdline_lower:
+            for keyword, label in _NODE_LABELS:
+                if keyword in cmdline_lower:
+                    return label
             return "node-process"
 
         # Python processes
-        if "python" in proc_name.lower():
+        if "python" in proc_name_lower:
             return "python-subprocess"
 
         # Claude CLI
@@ -254,7 +438,13 @@ class ProcessRegistry:
 
         Returns:
             Tuple of (success, message)
+
+        Raises:
+            ProcessNotRegistered: If the PID isn't in the registry
         """
+        if pid not in self._processes:
+            raise ProcessNotRegistered(pid)
+
         try:
             proc = psutil.Process(pid)
 
@@ -292,21 +482,7 @@ class ProcessRegistry:
         Returns:
             Tuple of (killed_count, failed_count)
         """
-        processes = self.get_by_project(project_name)
-        killed = 0
-        failed = 0
-
-        # Kill children first, then parents
-        sorted_procs = sorted(processes, key=lambda p: p.parent_pid is None)
-
-        for proc in sorted_procs:
-            success, _ = self.kill_process(proc.pid, force)
-            if success:
-                killed += 1
-            else:
-                failed += 1
-
-        return killed, failed
+        return self._kill_many(self.get_by_project(project_name), force)
 
     def kill_all(self, force: bool = False) -> tuple[int, int]:
         """
@@ -318,21 +494,80 @@ class ProcessRegistry:
         Returns:
             Tuple of (killed_count, failed_count)
         """
-        processes = self.get_all()
-        killed = 0
+        return self._kill_many(self.get_all(), force)
+
+    def _kill_many(self, processes: List[ProcessInfo], force: bool) -> tuple[int, int]:
+        """
+        Kill several processes concurrently.
+
+        Signals every process up front and then waits on all of them at
+        once, so the total wait is bounded by one timeout rather than one
+        timeout per process.
+
+        Args:
+            processes: Processes to kill
+            force: If True, use SIGKILL instead of SIGTERM
+
+        Returns:
+            Tuple of (killed_count, failed_count)
+        """
+        killed_pids: List[int] = []
         failed = 0
+        signalled: List[psutil.Process] = []
 
         # Kill children first, then parents
-        sorted_procs = sorted(processes, key=lambda p: p.parent_pid is None)
+        children: List[ProcessInfo] = []
+        parents: List[ProcessInfo] = []
+        for info in processes:
+            (parents if info.parent_pid is None else children).append(info)
+
+        for info in itertools.chain(children, parents):
+            try:
+                proc = psutil.Process(info.pid)
+                if force:
+                    proc.kill()  # SIGKILL
+                else:
+                    proc.terminate()  # SIGTERM
+                signalled.append(proc)
+            except psutil.NoSuchProcess:
+                killed_pids.append(info.pid)
+            except Exception as e:
+                logger.warning(f"Failed to kill process {info.pid}: {e}")
+                failed += 1
 
-        for proc in sorted_procs:
-            success, _ = self.kill_process(proc.pid, force)
-            if success:
-                killed += 1
-            else:
+        survivors: List[psutil.Process] = []
+        if not force and signalled:
+            # Wait briefly for graceful shutdown, then escalate to SIGKILL
+            _, alive = psutil.wait_procs(signalled, timeout=3)
+            escalated: List[psutil.Process] = []
+            for proc in alive:
+                try:
+                    proc.kill()
+                    escalated.append(proc)
+                except psutil.NoSuchProcess:
+                    pass
+                except Exception as e:
+                    # Count it as failed but keep going so every other
+                    # process still gets unregistered below
+                    logger.warning(f"Failed to kill process {proc.pid}: {e}")
+                    survivors.append(proc)
+            _, still_alive = psutil.wait_procs(escalated, timeout=2)
+            survivors.extend(still_alive)
+
+        survivor_pids = {proc.pid for proc in survivors}
+        for proc in signalled:
+            if proc.pid in survivor_pids:
                 failed += 1
+            else:
+                killed_pids.append(proc.pid)
+
+        # Unregister everything in one copy-on-write swap rather than per PID
+        with self._registry_lock:
+            removed = self._remove_all(killed_pids)
+        for info in removed:
+            logger.info(f"Unregistered process: {info.name} (PID {info.pid})")
 
-        return killed, failed
+        return len(killed_pids), failed
 
     def pause_process(self, pid: int) -> tuple[bool, str]:
         """
@@ -343,7 +578,13 @@ class ProcessRegistry:
 
         Returns:
             Tuple of (success, message)
+
+        Raises:
+            ProcessNotRegistered: If the PID isn't in the registry
         """
+        if pid not in self._processes:
+            raise ProcessNotRegistered(pid)
+
         try:
             proc = psutil.Process(pid)
             proc.suspend()
@@ -366,7 +607,13 @@ class ProcessRegistry:
 
         Returns:
             Tuple of (success, message)
+
+        Raises:
+            ProcessNotRegistered: If the PID isn't in the registry
         """
+        if pid not in self._processes:
+            raise ProcessNotRegistered(pid)
+
         try:
             proc = psutil.Process(pid)
             proc.resume()
@@ -387,16 +634,12 @@ class ProcessRegistry:
         Returns:
             Number of dead processes cleaned up
         """
-        cleaned = 0
         with self._registry_lock:
-            dead_pids = []
-            for pid in self._processes:
-                if not psutil.pid_exists(pid):
-                    dead_pids.append(pid)
-
-            for pid in dead_pids:
-                del self._processes[pid]
-                cleaned += 1
+            # One /proc listing instead of a pid_exists() probe per process.
+            # Taken under the lock so PIDs registered meanwhile aren't dropped.
+            alive = set(psutil.pids())
+            dead_pids = {pid for pid in self._processes if pid not in alive}
+            cleaned = len(self._remove_all(dead_pids))
 
         if cleaned:
             logger.info(f"Cleaned up {cleaned} dead process(es) from registry")
@@ -407,40 +650,56 @@ class ProcessRegistry:
         """
         Get all processes organized as a tree structure.
 
+        The result is cached for ``_tree_ttl`` seconds (or until the registry
+        changes). The generation is read before the snapshot, so a tree built
+        while a mutation is in flight is never served after it. Dead processes
+        are pruned by a background sweep, so building the tree never touches
+        psutil.
+
         Returns:
             List of root processes with nested children
         """
-        self.cleanup_dead_processes()
-
+        generation = self._generation
+        cached = self._tree_cache
+        if (
+            cached is not None
+            and cached[1] == generation
+            and time.monotonic() - cached[0] < self._tree_ttl
+        ):
+            return cached[2]
+
+        built_at = time.monotonic()
         processes = self.get_all()
 
         # Group by project
-        by_project: Dict[str, List[ProcessInfo]] = {}
+        by_project: Dict[str, List[ProcessInfo]] = defaultdict(list)
         for proc in processes:
-            if proc.project_name not in by_project:
-                by_project[proc.project_name] = []
             by_project[proc.project_name].append(proc)
 
         # Build tree for each project
         result = []
         for project_name, procs in by_project.items():
-            # Find root processes (no parent or parent not in our list)
             pids = {p.pid for p in procs}
-            roots = [p for p in procs if p.parent_pid is None or p.parent_pid not in pids]
-            children_map: Dict[int, List[ProcessInfo]] = {}
 
+            # Single pass: bucket every process under its parent PID
+            children_map: Dict[Optional[int], List[ProcessInfo]] = defaultdict(list)
             for proc in procs:
-                if proc.parent_pid and proc.parent_pid in pids:
-                    if proc.parent_pid not in children_map:
-                        children_map[proc.parent_pid] = []
-                    children_map[proc.parent_pid].append(proc)
+                children_map[proc.parent_pid].append(proc)
+
+            # Roots have no parent, or a parent that isn't in our list
+            roots = [
+                proc
+                for parent_pid, siblings in children_map.items()
+                if parent_pid is None or parent_pid not in pids
+                for proc in siblings
+            ]
 
             def build_node(proc: ProcessInfo) -> dict:
-                node = proc.to_dict()
-                node["children"] = [
-                    build_node(child) for child in children_map.get(proc.pid, [])
-                ]
-                return node
+                # Copy the memoized dict rather than adding children to it
+                return {
+                    **proc.to_dict(),
+                    "children": [build_node(child) for child in children_map.get(proc.pid, [])],
+                }
 
             project_tree = {
                 "project_name": project_name,
@@ -449,10 +708,33 @@ class ProcessRegistry:
             }
             result.append(project_tree)
 
+        self._tree_cache = (built_at, generation, result)
         return result
 
+    def get_process_tree_json(self) -> bytes:
+        """
+        Get the process tree pre-encoded as JSON.
+
+        The encoding is reused for as long as get_process_tree() keeps
+        returning the same cached tree.
+
+        Returns:
+            UTF-8 encoded JSON of the process tree
+        """
+        tree = self.get_process_tree()
+        cached = self._tree_json
+        if cached is not None and cached[0] is tree:
+            return cached[1]
+
+        encoded = json.dumps(tree, separators=(",", ":")).encode()
+        self._tree_json = (tree, encoded)
+        return encoded
+
+
+# Module-level singleton, created eagerly so lookups are a plain global read
+_registry = ProcessRegistry()
+
 
-# Module-level singleton accessor
 def get_registry() -> ProcessRegistry:
     """Get the singleton ProcessRegistry instance."""
-    return ProcessRegistry()
+    return _registry